@@ -8,6 +8,8 @@ import requests
 from datetime import datetime, timedelta
 import os
 import sqlite3
+import threading
+import traceback
 from typing import Dict, List, Any, Optional, Union
 import ollama
 import psutil
@@ -33,11 +35,23 @@ class AIAnalyzer:
         self.api_endpoint = os.environ.get("OPENAI_ENDPOINT", "https://api.openai.com")
         self.ollama_host = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
         self.db_path = db_path
+        self._conn = None
+        self._conn_lock = threading.Lock()
         
         # Ensure the database has the correct schema
         if db_path:
             self._init_database()
 
+        self.model = self._select_model(api_type)
+
+    def _select_model(self, api_type):
+        """Pick the model to use for the given API type."""
+        if "AI_MODEL" in os.environ:
+            return os.environ["AI_MODEL"]
+
+        if api_type != "ollama":
+            return "gpt-3.5-turbo"
+
         ollama_model_options = [
             {
                 **model,
@@ -53,19 +67,16 @@ class AIAnalyzer:
 
         ollama_model_options.sort(key=lambda x: x["score"], reverse=True)
         print(ollama_model_options)
-        self.model = os.environ.get(
-            "AI_MODEL",
-            (
-                ollama_model_options[0]["name"]
-                if api_type == "ollama"
-                else "gpt-3.5-turbo"
-            ),
-        )
+        return ollama_model_options[0]["name"]
 
     def _init_database(self):
         """Initialize the database schema if needed."""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
+
+        # Use write-ahead logging so the analysis worker's writes don't block
+        # readers on the main connection (the journal mode persists in the file)
+        cursor.execute("PRAGMA journal_mode=WAL")
         
         # Check if analysis_results table exists, create if not
         cursor.execute(
@@ -97,10 +108,43 @@ class AIAnalyzer:
         
         if "productivity_explanation" not in columns:
             cursor.execute("ALTER TABLE analysis_results ADD COLUMN productivity_explanation TEXT")
+
+        # Index the lookup used when clearing a cached analysis
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_analysis_date_range ON analysis_results(date_range, start_date, end_date)"
+        )
         
         conn.commit()
         conn.close()
 
+    def _get_connection(self):
+        """Return the shared analysis database connection, opening it on first use."""
+        if self._conn is None:
+            # Shared between the UI thread and analysis workers; callers hold _conn_lock
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
+
+    def clear_cached_analysis(self, date_range: str, start_date: datetime, end_date: datetime):
+        """Delete any saved analysis for the given date range and bounds."""
+        if not self.db_path:
+            return
+
+        with self._conn_lock:
+            conn = self._get_connection()
+            conn.execute(
+                """
+            DELETE FROM analysis_results 
+            WHERE date_range = ? AND start_date = ? AND end_date = ?
+            """,
+                (date_range, start_date.isoformat(), end_date.isoformat()),
+            )
+            conn.commit()
+
+        print(
+            f"Deleted cached analysis for {date_range} ({start_date.isoformat()} to {end_date.isoformat()})"
+        )
+
     def init_db(self):
         """Initialize the database for storing analysis results."""
         conn = sqlite3.connect(self.db_path)
@@ -212,7 +256,6 @@ class AIAnalyzer:
                 }
         except Exception as e:
             print(f"Error in analyze_activities: {e}")
-            import traceback
             traceback.print_exc()
             return {
                 "summary": f"Analysis failed: {str(e)}",
@@ -232,19 +275,19 @@ class AIAnalyzer:
             # Get date range bounds
             start_date, end_date = self._get_date_range_bounds(date_range, activities)
             
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Get the latest analysis for this date range
-            cursor.execute('''
-            SELECT id, summary, patterns, insights, recommendations, productivity_score, productivity_explanation, created_at 
-            FROM analysis_results 
-            WHERE date_range = ? 
-            ORDER BY created_at DESC 
-            LIMIT 1
-            ''', (date_range,))
-            
-            row = cursor.fetchone()
+            with self._conn_lock:
+                cursor = self._get_connection().cursor()
+                
+                # Get the latest analysis for this date range
+                cursor.execute('''
+                SELECT id, summary, patterns, insights, recommendations, productivity_score, productivity_explanation, created_at 
+                FROM analysis_results 
+                WHERE date_range = ? 
+                ORDER BY created_at DESC 
+                LIMIT 1
+                ''', (date_range,))
+                
+                row = cursor.fetchone()
             
             if row:
                 analysis_id, summary, patterns, insights, recommendations, productivity_score, productivity_explanation, timestamp = row
@@ -308,9 +351,6 @@ class AIAnalyzer:
             return
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             # Convert lists to JSON strings for storage
             patterns_json = json.dumps(result.get("patterns", []))
             insights_json = json.dumps(result.get("insights", []))
@@ -326,30 +366,33 @@ class AIAnalyzer:
             except (ValueError, TypeError):
                 productivity_score = 0.0
             
-            # Insert the analysis results
-            cursor.execute('''
-            INSERT OR REPLACE INTO analysis_results 
-            (id, date_range, start_date, end_date, api_type, model, summary, patterns, insights, recommendations, productivity_score, productivity_explanation, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                None,
-                date_range,
-                start_date.isoformat(),
-                end_date.isoformat(),
-                self.api_type,
-                self.model,
-                result.get("summary", ""),
-                patterns_json,
-                insights_json,
-                recommendations_json,
-                productivity_score,
-                productivity_explanation,
-                datetime.now().isoformat()
-            ))
+            with self._conn_lock:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+
+                # Insert the analysis results
+                cursor.execute('''
+                INSERT OR REPLACE INTO analysis_results 
+                (id, date_range, start_date, end_date, api_type, model, summary, patterns, insights, recommendations, productivity_score, productivity_explanation, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    None,
+                    date_range,
+                    start_date.isoformat(),
+                    end_date.isoformat(),
+                    self.api_type,
+                    self.model,
+                    result.get("summary", ""),
+                    patterns_json,
+                    insights_json,
+                    recommendations_json,
+                    productivity_score,
+                    productivity_explanation,
+                    datetime.now().isoformat()
+                ))
             
-            analysis_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
+                analysis_id = cursor.lastrowid
+                conn.commit()
             
             print(f"Saved analysis with ID: {analysis_id}")
             return analysis_id
@@ -562,7 +605,6 @@ Provide at least 2-3 patterns, 2-3 insights, and 2-3 recommendations. Focus on a
             return response["message"]["content"]
         except Exception as e:
             print(f"Error querying Ollama: {e}")
-            import traceback
             traceback.print_exc()
             raise RuntimeError(f"Failed to get analysis from Ollama: {e}")
 
@@ -617,7 +659,6 @@ Provide at least 2-3 patterns, 2-3 insights, and 2-3 recommendations. Focus on a
             
         except Exception as e:
             print(f"Error querying OpenAI: {e}")
-            import traceback
             traceback.print_exc()
             raise RuntimeError(f"Failed to get analysis from OpenAI: {e}")
 
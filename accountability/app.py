@@ -3,15 +3,15 @@ Main Application Module for Accountability App.
 """
 
 import sys
-import os
 from PyQt6.QtWidgets import QSystemTrayIcon, QMenu, QMessageBox, QLabel, QApplication
-from PyQt6.QtGui import QIcon, QColor, QPixmap, QAction
+from PyQt6.QtGui import QIcon, QColor, QAction
 from PyQt6.QtCore import QTimer, Qt, QDateTime, QTime
 
 from accountability.scheduler import ActivityScheduler
 from accountability.database import Database
 from accountability.ui.main_window import MainWindow
 from accountability.ui.reminder import ReminderDialog
+from accountability.ui.style import LOGO_PATH, load_logo
 
 
 class AccountabilityApp:
@@ -49,6 +49,9 @@ class AccountabilityApp:
         # Flag to prevent multiple reminders
         self.reminder_showing = False
 
+        # Reminder dialog, built on first use and reused for later reminders
+        self.reminder_dialog = None
+
     def start(self):
         """Start the application and initialize components."""
         # Load initial data and settings
@@ -116,8 +119,12 @@ class AccountabilityApp:
     def show_reminder_for_hours(self, hours):
         """Show the reminder dialog for the specified hours."""
         self.reminder_showing = True
-        dialog = ReminderDialog(hours, self.db, self.scheduler)
-        dialog.finished.connect(self.on_reminder_closed)
+        if self.reminder_dialog is None:
+            self.reminder_dialog = ReminderDialog(hours, self.db, self.scheduler)
+            self.reminder_dialog.finished.connect(self.on_reminder_closed)
+        else:
+            self.reminder_dialog.set_hours(hours)
+        dialog = self.reminder_dialog
 
         # Show notification if system supports it
         if QSystemTrayIcon.supportsMessages():
@@ -176,13 +183,10 @@ class AccountabilityApp:
             return
 
         # Create tray icon with the custom logo
-        icon_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "ui", "resources", "logo.png"
-        )
-        print(f"Loading tray icon from: {icon_path}")
+        print(f"Loading tray icon from: {LOGO_PATH}")
 
-        # Create a QPixmap from the image file first
-        pixmap = QPixmap(icon_path)
+        # Reuse the logo decoded for the window icon
+        pixmap = load_logo()
         if not pixmap.isNull():
             # Scale down if needed
             if pixmap.width() > 64 or pixmap.height() > 64:
@@ -275,6 +279,8 @@ class AccountabilityApp:
         import json
         import os
         from datetime import datetime, timedelta
+        from itertools import groupby
+        from operator import itemgetter
         
         # Ask user for file location and format
         file_path, selected_filter = QFileDialog.getSaveFileName(
@@ -300,35 +306,27 @@ class AccountabilityApp:
                     success = self.db.export_activities_to_text(file_path)
             else:
                 # Fallback to our own implementation
-                # Get all activities from the database
-                all_activities = []
-
                 # Get activities for the last year as a reasonable default
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=365)
 
-                current_date = start_date
-                while current_date <= end_date:
-                    day_start = datetime(
-                        current_date.year, current_date.month, current_date.day
-                    )
-                    day_activities = self.db.get_activities_for_day(day_start)
-                    all_activities.extend(day_activities)
-                    current_date += timedelta(days=1)
-
-                activities_to_export = all_activities
+                activities_to_export = self.db.get_activities_for_date_range(
+                    start_date, end_date
+                )
                 date_range = "Last Year"
 
+                # Sort once so the text export can group consecutive days
+                activities_to_export = sorted(activities_to_export, key=itemgetter("hour"))
+
                 # Format the activities for export
-                formatted_activities = []
-                for activity in activities_to_export:
-                    formatted_activities.append(
-                        {
-                            "date": activity["hour"].strftime("%Y-%m-%d"),
-                            "time": activity["hour"].strftime("%H:%M"),
-                            "activity": activity["activity"],
-                        }
-                    )
+                formatted_activities = [
+                    {
+                        "date": activity["hour"].strftime("%Y-%m-%d"),
+                        "time": activity["hour"].strftime("%H:%M"),
+                        "activity": activity["activity"],
+                    }
+                    for activity in activities_to_export
+                ]
 
                 # Prepare the export data
                 export_data = {
@@ -344,27 +342,25 @@ class AccountabilityApp:
                         json.dump(export_data, f, indent=2)
                     success = True
                 else:
-                    # Text export
-                    with open(file_path, "w") as f:
-                        f.write(f"Activity Export - {date_range}\n")
-                        f.write(
-                            f"Exported on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                    # Text export, assembled in memory and written in one call
+                    lines = [
+                        f"Activity Export - {date_range}\n",
+                        f"Exported on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+                    ]
+
+                    # Add each date's activities (already in date/time order)
+                    for date, activities in groupby(
+                        formatted_activities, key=itemgetter("date")
+                    ):
+                        lines.append(f"=== {date} ===\n")
+                        lines.extend(
+                            f"{activity['time']}: {activity['activity']}\n"
+                            for activity in activities
                         )
+                        lines.append("\n")
 
-                        # Group by date
-                        activities_by_date = {}
-                        for activity in formatted_activities:
-                            date = activity["date"]
-                            if date not in activities_by_date:
-                                activities_by_date[date] = []
-                            activities_by_date[date].append(activity)
-
-                        # Write each date's activities
-                        for date, activities in sorted(activities_by_date.items()):
-                            f.write(f"=== {date} ===\n")
-                            for activity in sorted(activities, key=lambda x: x["time"]):
-                                f.write(f"{activity['time']}: {activity['activity']}\n")
-                            f.write("\n")
+                    with open(file_path, "w") as f:
+                        f.writelines(lines)
                     success = True
 
             if success:
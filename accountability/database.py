@@ -3,9 +3,16 @@ Database Module for Accountability App.
 Handles persistence of activities and settings.
 """
 
+import json
 import os
 import sqlite3
 from datetime import datetime
+from urllib.request import pathname2url
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
 
 class Database:
@@ -27,12 +34,18 @@ class Database:
         self.db_path = db_path
         self.conn = None
         self.cursor = None
+        self._readonly = False
 
     def initialize(self):
         """Initialize the database connection and tables."""
         self.conn = sqlite3.connect(self.db_path)
         # Enable foreign keys
         self.conn.execute("PRAGMA foreign_keys = ON")
+        # Use write-ahead logging so background readers don't block the UI
+        # connection (the journal mode persists in the file)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        # WAL journaling is safe with NORMAL sync and avoids an fsync per commit
+        self.conn.execute("PRAGMA synchronous = NORMAL")
         # Use Row as the row factory
         self.conn.row_factory = sqlite3.Row
         self.cursor = self.conn.cursor()
@@ -40,12 +53,29 @@ class Database:
         # Create tables if they don't exist
         self._create_tables()
 
+    def open_readonly(self):
+        """Open a read-only connection without touching the schema.
+
+        Meant for short-lived background readers; the UI connection has
+        already run initialize() on the same file.
+        """
+        self.conn = sqlite3.connect(
+            f"file:{pathname2url(self.db_path)}?mode=ro", uri=True
+        )
+        self.conn.row_factory = sqlite3.Row
+        self.cursor = self.conn.cursor()
+        self._readonly = True
+
     def close(self):
         """Close the database connection."""
         if self.conn:
+            if not self._readonly:
+                # Let SQLite refresh query planner statistics before closing
+                self.conn.execute("PRAGMA optimize")
             self.conn.close()
             self.conn = None
             self.cursor = None
+            self._readonly = False
 
     def _create_tables(self):
         """Create the necessary database tables if they don't exist."""
@@ -320,8 +350,6 @@ class Database:
             bool: True if successful, False otherwise
         """
         try:
-            import json
-
             activities = self.get_all_activities()
 
             # Format activities for export
@@ -360,8 +388,12 @@ class Database:
             }
 
             # Write to file
-            with open(file_path, "w") as f:
-                json.dump(export_data, f, indent=2)
+            if orjson is not None:
+                with open(file_path, "wb") as f:
+                    f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(file_path, "w") as f:
+                    json.dump(export_data, f, indent=2)
 
             return True
         except Exception as e:
@@ -397,31 +429,34 @@ class Database:
                 if note:  # Only include non-empty notes
                     notes_by_date[date_str] = note
 
-            # Write to file
-            with open(file_path, "w") as f:
-                f.write("Accountability App - Activity Export\n")
-                f.write(
-                    f"Exported on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-                )
-                f.write(f"Total activities: {len(activities)}\n")
-                f.write(f"Total daily notes: {len(notes_by_date)}\n\n")
+            # Assemble the export in memory and write it in one call
+            lines = [
+                "Accountability App - Activity Export\n",
+                f"Exported on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+                f"Total activities: {len(activities)}\n",
+                f"Total daily notes: {len(notes_by_date)}\n\n",
+            ]
+
+            for date_str, day_activities in sorted(activities_by_date.items()):
+                lines.append(f"=== {date_str} ===\n")
 
-                for date_str, day_activities in sorted(activities_by_date.items()):
-                    f.write(f"=== {date_str} ===\n")
+                # Sort by hour
+                day_activities.sort(key=lambda x: x["hour"])
 
-                    # Sort by hour
-                    day_activities.sort(key=lambda x: x["hour"])
+                for activity in day_activities:
+                    time_str = activity["hour"].strftime("%H:%M")
+                    lines.append(f"{time_str}: {activity['activity']}\n")
 
-                    for activity in day_activities:
-                        time_str = activity["hour"].strftime("%H:%M")
-                        f.write(f"{time_str}: {activity['activity']}\n")
+                # Add daily note if it exists
+                if date_str in notes_by_date:
+                    lines.append("\nDAILY NOTE:\n")
+                    lines.append(f"{notes_by_date[date_str]}\n")
 
-                    # Add daily note if it exists
-                    if date_str in notes_by_date:
-                        f.write("\nDAILY NOTE:\n")
-                        f.write(f"{notes_by_date[date_str]}\n")
+                lines.append("\n")
 
-                    f.write("\n")
+            # Write to file
+            with open(file_path, "w") as f:
+                f.writelines(lines)
 
             return True
         except Exception as e:
@@ -23,70 +23,132 @@ from PyQt6.QtWidgets import (
     QGraphicsView,
     QGraphicsScene,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, QDate, QRectF, QPointF
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer, QDate, QRectF, QPointF
 from PyQt6.QtGui import QFont, QIcon, QPainterPath, QPainter, QBrush, QPen, QColor
 from math import pi, cos, sin
 
 from ..ai_analysis import AIAnalyzer
+from ..database import Database
+from ..utils.time_utils import get_day_start, get_day_end
 import os
+import html
 import json
 import logging
 from datetime import datetime, timedelta
+from functools import partial
+from itertools import groupby
+from operator import itemgetter
 from typing import Dict, Any, Optional, List, Tuple
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _bullet_html(items):
+    """Render a list of strings as an escaped HTML bulleted list."""
+    return "<ul>" + "".join(f"<li>{html.escape(str(item))}</li>" for item in items) + "</ul>"
+
+
+def _results_signature(results):
+    """Return a comparable snapshot of the fields rendered from an analysis result."""
+    return (
+        results.get("summary"),
+        tuple(results.get("patterns") or ()),
+        tuple(results.get("insights") or ()),
+        tuple(results.get("recommendations") or ()),
+        results.get("productivity_score"),
+        results.get("productivity_explanation"),
+    )
+
+
+def _this_week_range(now):
+    """Return the bounds of the current week, starting on Monday."""
+    return get_day_start(now - timedelta(days=now.weekday())), now
+
+
+def _last_week_range(now):
+    """Return the bounds of the previous Monday-to-Sunday week."""
+    start_of_last_week = get_day_start(now - timedelta(days=now.weekday() + 7))
+    return start_of_last_week, get_day_end(start_of_last_week + timedelta(days=6))
+
+
+def _last_month_range(now):
+    """Return the bounds of the previous calendar month."""
+    end_of_last_month = datetime(now.year, now.month, 1) - timedelta(seconds=1)
+    return (
+        datetime(end_of_last_month.year, end_of_last_month.month, 1),
+        end_of_last_month,
+    )
+
+
 class AnalysisWorker(QThread):
     """Worker thread for running AI analysis without blocking the UI."""
 
     analysis_complete = pyqtSignal(dict)
     analysis_error = pyqtSignal(str)
+    progress = pyqtSignal(str)
 
     def __init__(
-        self, analyzer, activities, date_range, force_reload=False, notes_dict=None
+        self, analyzer, database, date_range, start_date, end_date, force_reload=False
     ):
         """Initialize the worker thread."""
         super().__init__()
         self.analyzer = analyzer
-        self.activities = activities
+        self.database = database
         self.date_range = date_range
+        self.start_date = start_date
+        self.end_date = end_date
         self.force_reload = force_reload
-        self.notes_dict = notes_dict
+        self.activities = []
+        self.notes_dict = {}
+
+    def load_data(self):
+        """Load the activities and daily notes for the analysis period."""
+        # sqlite3 connections are bound to the thread that opened them, so read
+        # through a connection of our own (WAL keeps this from blocking the UI)
+        db = Database(self.database.db_path)
+        try:
+            db.open_readonly()
+            self.activities = db.get_activities_for_date_range(
+                self.start_date, self.end_date
+            )
+
+            # Daily notes only annotate activities, so there's nothing to fetch
+            # when the period has none
+            if self.activities:
+                self.notes_dict = db.get_notes_for_date_range(
+                    self.start_date, self.end_date
+                )
+                print(f"Retrieved {len(self.notes_dict)} daily notes for analysis")
+        finally:
+            db.close()
 
     def run(self):
         """Run the analysis in a separate thread."""
         try:
-            # If force_reload is True, we'll clear any cached analysis first
-            if (
-                self.force_reload
-                and hasattr(self.analyzer, "db_path")
-                and self.analyzer.db_path
-            ):
-                import sqlite3
+            self.progress.emit("Loading activities...")
+            self.load_data()
 
-                conn = sqlite3.connect(self.analyzer.db_path)
-                cursor = conn.cursor()
+            # A newer analysis was requested while loading; don't query the AI
+            if self.isInterruptionRequested():
+                return
 
-                # Calculate date range
+            # If force_reload is True, we'll clear any cached analysis first
+            if self.force_reload:
                 start_date, end_date = self.analyzer._get_date_range_bounds(
                     self.date_range, self.activities
                 )
                 if start_date and end_date:
-                    # Delete any existing analysis for this date range
-                    cursor.execute(
-                        """
-                    DELETE FROM analysis_results 
-                    WHERE date_range = ? AND start_date = ? AND end_date = ?
-                    """,
-                        (self.date_range, start_date.isoformat(), end_date.isoformat()),
-                    )
-                    conn.commit()
-                    print(
-                        f"Deleted cached analysis for {self.date_range} ({start_date.isoformat()} to {end_date.isoformat()})"
+                    self.analyzer.clear_cached_analysis(
+                        self.date_range, start_date, end_date
                     )
-                conn.close()
 
             # Run the analysis
+            self.progress.emit(f"Analyzing {len(self.activities)} activities...")
             print(
                 f"Starting analysis for {self.date_range} with {len(self.activities)} activities"
             )
@@ -103,15 +165,44 @@ class AnalysisWorker(QThread):
 class AnalysisWidget(QWidget):
     """Widget for displaying AI analysis of user activities."""
 
-    def __init__(self, database, analyzer, parent=None):
+    # Preset periods shown in the date range selector, mapped to functions
+    # returning their (start, end) bounds for a given "now"
+    _PERIOD_RANGES = {
+        "Today": lambda now: (get_day_start(now), now),
+        "Yesterday": lambda now: (
+            get_day_start(now - timedelta(days=1)),
+            get_day_end(now - timedelta(days=1)),
+        ),
+        "This Week": _this_week_range,
+        "Last Week": _last_week_range,
+        "This Month": lambda now: (datetime(now.year, now.month, 1), now),
+        "Last Month": _last_month_range,
+    }
+
+    def __init__(self, database, analyzer=None, parent=None):
         """Initialize the analysis widget."""
         super().__init__(parent)
         self.activities_db = database
         self.analyzer = analyzer
         self.analysis_in_progress = False
         self.current_date_range = "Today"
+        self._rendered_signature = None
+        self.worker = None
+        self._retired_workers = set()
         self.setup_ui()
 
+        # Let the window paint before creating the analyzer and running the
+        # first analysis
+        QTimer.singleShot(0, self._post_init)
+
+    def _post_init(self):
+        """Create the analyzer if needed and start the initial analysis."""
+        if self.analyzer is None:
+            db_path = getattr(self.activities_db, "db_path", None)
+            self.analyzer = AIAnalyzer(db_path=db_path)
+
+        self.update_analysis()
+
     def setup_ui(self):
         """Set up the UI elements."""
         main_layout = QVBoxLayout(self)
@@ -124,17 +215,7 @@ class AnalysisWidget(QWidget):
         # Date range selector
         date_range_label = QLabel("Date Range:")
         self.date_range_combo = QComboBox()
-        self.date_range_combo.addItems(
-            [
-                "Today",
-                "Yesterday",
-                "This Week",
-                "Last Week",
-                "This Month",
-                "Last Month",
-                "Custom Range",
-            ]
-        )
+        self.date_range_combo.addItems(list(self._PERIOD_RANGES) + ["Custom Range"])
         self.date_range_combo.currentIndexChanged.connect(self.on_date_range_changed)
 
         # Custom date range controls (initially hidden)
@@ -237,9 +318,6 @@ class AnalysisWidget(QWidget):
         self.start_date_calendar.setSelectedDate(QDate.currentDate().addDays(-7))
         self.end_date_calendar.setSelectedDate(QDate.currentDate())
 
-        # Update analysis
-        self.update_analysis()
-
     def on_date_range_changed(self, index):
         """Handle date range selection change."""
         # Hide date range picker by default
@@ -261,6 +339,7 @@ class AnalysisWidget(QWidget):
     def update_analysis(self, force_reload=False):
         """Start the AI analysis process."""
         # Show loading indicator
+        self.loading_label.setText("Analysis in progress...")
         self.loading_label.setVisible(True)
         self.refresh_button.setEnabled(False)
 
@@ -268,43 +347,7 @@ class AnalysisWidget(QWidget):
         period_text = self.date_range_combo.currentText()
 
         # Calculate date range
-        end_date = datetime.now()
-        start_date = None
-
-        if period_text == "Today":
-            start_date = datetime(end_date.year, end_date.month, end_date.day)
-        elif period_text == "Yesterday":
-            yesterday = end_date - timedelta(days=1)
-            start_date = datetime(yesterday.year, yesterday.month, yesterday.day)
-            end_date = datetime(
-                yesterday.year, yesterday.month, yesterday.day, 23, 59, 59
-            )
-        elif period_text == "This Week":
-            # Start of current week (Monday)
-            start_date = end_date - timedelta(days=end_date.weekday())
-            start_date = datetime(start_date.year, start_date.month, start_date.day)
-        elif period_text == "Last Week":
-            # Start of last week (Monday)
-            start_of_last_week = end_date - timedelta(days=end_date.weekday() + 7)
-            start_date = datetime(
-                start_of_last_week.year, start_of_last_week.month, start_of_last_week.day
-            )
-            end_of_last_week = start_of_last_week + timedelta(days=6)
-            end_date = datetime(
-                end_of_last_week.year, end_of_last_week.month, end_of_last_week.day, 23, 59, 59
-            )
-        elif period_text == "This Month":
-            # Start of current month
-            start_date = datetime(end_date.year, end_date.month, 1)
-        elif period_text == "Last Month":
-            # Start of last month
-            if end_date.month == 1:
-                start_date = datetime(end_date.year - 1, 12, 1)
-                end_date = datetime(end_date.year, 1, 1) - timedelta(seconds=1)
-            else:
-                start_date = datetime(end_date.year, end_date.month - 1, 1)
-                end_date = datetime(end_date.year, end_date.month, 1) - timedelta(seconds=1)
-        elif period_text == "Custom Range":
+        if period_text == "Custom Range":
             # Get dates from calendar widgets
             start_qdate = self.start_date_calendar.selectedDate()
             end_qdate = self.end_date_calendar.selectedDate()
@@ -318,47 +361,59 @@ class AnalysisWidget(QWidget):
                 self.handle_analysis_error("Start date must be before or equal to end date.")
                 return
         else:
-            start_date = end_date - timedelta(days=1)
-
-        # Get activities for the date range
-        activities = []
-        current_date = start_date
-
-        while current_date <= end_date:
-            day_start = datetime(
-                current_date.year, current_date.month, current_date.day
-            )
-            day_activities = self.activities_db.get_activities_for_day(day_start)
-            activities.extend(day_activities)
-            current_date += timedelta(days=1)
-
-        # Get daily notes for the date range
-        notes_dict = {}
-        if hasattr(self.activities_db, "get_notes_for_date_range"):
-            try:
-                notes_dict = self.activities_db.get_notes_for_date_range(start_date, end_date)
-                print(f"Retrieved {len(notes_dict)} daily notes for analysis")
-            except Exception as e:
-                print(f"Error retrieving daily notes: {e}")
-
-        # Set API type based on selection
-        api_type = (
-            "ollama" if self.analyzer.api_type == "ollama" else "openai"
-        )
+            now = datetime.now()
+            period_range = self._PERIOD_RANGES.get(period_text)
+            if period_range is not None:
+                start_date, end_date = period_range(now)
+            else:
+                start_date, end_date = now - timedelta(days=1), now
 
         # Store current date range
         self.current_date_range = period_text
 
+        # Detach any analysis still running for a previous selection
+        self._retire_worker()
+
         # Create and start worker thread
         self.worker = AnalysisWorker(
-            self.analyzer, activities, period_text, force_reload, notes_dict
+            self.analyzer,
+            self.activities_db,
+            period_text,
+            start_date,
+            end_date,
+            force_reload,
         )
+        self.worker.progress.connect(self.loading_label.setText)
         self.worker.analysis_complete.connect(self.update_analysis_results)
         self.worker.analysis_error.connect(self.handle_analysis_error)
-        self.worker.finished.connect(lambda: self.refresh_button.setEnabled(True))
-        self.worker.finished.connect(lambda: self.loading_label.setVisible(False))
+        self.worker.finished.connect(partial(self._on_worker_finished, self.worker))
         self.worker.start()
 
+    def _retire_worker(self):
+        """Stop the current worker from delivering results and let it wind down."""
+        worker = self.worker
+        self.worker = None
+        if worker is None or not worker.isRunning():
+            return
+
+        worker.requestInterruption()
+        worker.progress.disconnect()
+        worker.analysis_complete.disconnect()
+        worker.analysis_error.disconnect()
+        worker.quit()
+        if not worker.wait(200):
+            # Still waiting on the AI service; keep it referenced until it finishes
+            self._retired_workers.add(worker)
+
+    def _on_worker_finished(self, worker):
+        """Release a worker thread once it has finished."""
+        self._retired_workers.discard(worker)
+        if worker is self.worker:
+            self.worker = None
+            self.refresh_button.setEnabled(True)
+            self.loading_label.setVisible(False)
+        worker.deleteLater()
+
     def update_analysis_results(self, results):
         """Update the UI with analysis results."""
         # Hide loading indicator
@@ -368,6 +423,15 @@ class AnalysisWidget(QWidget):
         # Store current analysis
         self.current_analysis = results
 
+        # Skip rebuilding the cards if this analysis is already on screen
+        signature = _results_signature(results)
+        if (
+            signature == self._rendered_signature
+            and self.content_stack.currentWidget() is self.scroll_area
+        ):
+            return
+        self._rendered_signature = signature
+
         # Hide placeholder and show results container
         self.content_stack.setCurrentWidget(self.scroll_area)
 
@@ -461,10 +525,7 @@ class AnalysisWidget(QWidget):
             patterns_text.setMinimumHeight(150)
 
             # Format the patterns as a bulleted list
-            patterns_html = "<ul>"
-            for pattern in results["patterns"]:
-                patterns_html += f"<li>{pattern}</li>"
-            patterns_html += "</ul"
+            patterns_html = _bullet_html(results["patterns"])
 
             patterns_text.setHtml(patterns_html)
             patterns_card = self.create_card("Activity Patterns", patterns_text)
@@ -477,10 +538,7 @@ class AnalysisWidget(QWidget):
             insights_text.setMinimumHeight(150)
 
             # Format the insights as a bulleted list
-            insights_html = "<ul>"
-            for insight in results["insights"]:
-                insights_html += f"<li>{insight}</li>"
-            insights_html += "</ul"
+            insights_html = _bullet_html(results["insights"])
 
             insights_text.setHtml(insights_html)
             insights_card = self.create_card("Key Insights", insights_text)
@@ -499,10 +557,7 @@ class AnalysisWidget(QWidget):
         recommendations_text.setMinimumHeight(150)
 
         # Format the recommendations as a bulleted list
-        recommendations_html = "<ul>"
-        for recommendation in results["recommendations"]:
-            recommendations_html += f"<li>{recommendation}</li>"
-        recommendations_html += "</ul"
+        recommendations_html = _bullet_html(results["recommendations"])
 
         recommendations_text.setHtml(recommendations_html)
         recommendations_card = self.create_card("Recommendations", recommendations_text)
@@ -663,9 +718,6 @@ class AnalysisWidget(QWidget):
                     success = self.activities_db.export_activities_to_text(file_path)
             else:
                 # Fallback to our own implementation
-                # Get all activities from the database
-                all_activities = []
-
                 # If we have a specific date range selected, use those activities
                 if self.current_activities:
                     activities_to_export = self.current_activities
@@ -676,28 +728,25 @@ class AnalysisWidget(QWidget):
                     end_date = datetime.now()
                     start_date = end_date - timedelta(days=365)
 
-                    current_date = start_date
-                    while current_date <= end_date:
-                        day_start = datetime(
-                            current_date.year, current_date.month, current_date.day
-                        )
-                        day_activities = self.activities_db.get_activities_for_day(day_start)
-                        all_activities.extend(day_activities)
-                        current_date += timedelta(days=1)
-
-                    activities_to_export = all_activities
+                    activities_to_export = self.activities_db.get_activities_for_date_range(
+                        start_date, end_date
+                    )
                     date_range = "All Time"
 
+                # Sort once so the text export can group consecutive days
+                activities_to_export = sorted(activities_to_export, key=itemgetter("hour"))
+
                 # Format the activities for export
-                formatted_activities = []
-                for activity in activities_to_export:
-                    formatted_activities.append(
-                        {
-                            "date": activity["hour"].strftime("%Y-%m-%d"),
-                            "time": activity["hour"].strftime("%H:%M"),
-                            "activity": activity["activity"],
-                        }
-                    )
+                date_format = "%Y-%m-%d"
+                time_format = "%H:%M"
+                formatted_activities = [
+                    {
+                        "date": activity["hour"].strftime(date_format),
+                        "time": activity["hour"].strftime(time_format),
+                        "activity": activity["activity"],
+                    }
+                    for activity in activities_to_export
+                ]
 
                 # Prepare the export data
                 export_data = {
@@ -709,31 +758,33 @@ class AnalysisWidget(QWidget):
                 # Export based on file extension
                 if file_path.lower().endswith(".json"):
                     # JSON export
-                    with open(file_path, "w") as f:
-                        json.dump(export_data, f, indent=2)
+                    if orjson is not None:
+                        with open(file_path, "wb") as f:
+                            f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+                    else:
+                        with open(file_path, "w") as f:
+                            json.dump(export_data, f, indent=2)
                     success = True
                 else:
-                    # Text export
-                    with open(file_path, "w") as f:
-                        f.write(f"Activity Export - {date_range}\n")
-                        f.write(
-                            f"Exported on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                    # Text export, assembled in memory and written in one call
+                    lines = [
+                        f"Activity Export - {date_range}\n",
+                        f"Exported on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+                    ]
+
+                    # Add each date's activities (already in date/time order)
+                    for date, activities in groupby(
+                        formatted_activities, key=itemgetter("date")
+                    ):
+                        lines.append(f"=== {date} ===\n")
+                        lines.extend(
+                            f"{activity['time']}: {activity['activity']}\n"
+                            for activity in activities
                         )
+                        lines.append("\n")
 
-                        # Group by date
-                        activities_by_date = {}
-                        for activity in formatted_activities:
-                            date = activity["date"]
-                            if date not in activities_by_date:
-                                activities_by_date[date] = []
-                            activities_by_date[date].append(activity)
-
-                        # Write each date's activities
-                        for date, activities in sorted(activities_by_date.items()):
-                            f.write(f"=== {date} ===\n")
-                            for activity in sorted(activities, key=lambda x: x["time"]):
-                                f.write(f"{activity['time']}: {activity['activity']}\n")
-                            f.write("\n")
+                    with open(file_path, "w") as f:
+                        f.writelines(lines)
                     success = True
 
             if success:
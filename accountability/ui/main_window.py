@@ -5,6 +5,7 @@ Provides the primary interface for viewing activity history.
 
 from datetime import datetime, timedelta
 import json
+import logging
 import os
 import traceback
 from typing import List, Dict, Any, Optional, Set, Tuple, Union
@@ -25,6 +26,7 @@ from PyQt6.QtWidgets import (
     QComboBox,
     QListWidget,
     QListWidgetItem,
+    QListView,
     QTabWidget,
     QFrame,
     QDialog,
@@ -33,19 +35,56 @@ from PyQt6.QtWidgets import (
     QAbstractItemView,
     QGridLayout,
     QDialogButtonBox,
+    QButtonGroup,
+    QAbstractButton,
+)
+from PyQt6.QtCore import (
+    QTime,
+    Qt,
+    QDate,
+    pyqtSlot,
+    QSize,
+    QEvent,
+    QAbstractListModel,
+    QModelIndex,
+    QItemSelection,
+    QItemSelectionModel,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
 )
-from PyQt6.QtCore import QTime, Qt, QDate, pyqtSlot, QSize, QEvent
 from PyQt6.QtGui import QFont, QColor, QIcon, QPixmap
 
 
-from accountability.utils.time_utils import format_hour_range
+from accountability.database import Database
+from accountability.utils.time_utils import format_hour_range, HOUR_RANGES
 from .reminder import ReminderDialog
 from .analysis_widget import AnalysisWidget
 
+logger = logging.getLogger(__name__)
+
 
 class ActivityInputDialog(QDialog):
     """Dialog for entering or editing an activity."""
 
+    # Quick select labels (could be populated from frequently used activities)
+    COMMON_ACTIVITIES = (
+        "Working",
+        "Meeting",
+        "Eating",
+        "Break",
+        "Exercise",
+        "Reading",
+        "Learning",
+        "Sleeping",
+        "Coding",
+        "Writing",
+        "Planning",
+        "Relaxing",
+    )
+
     def __init__(self, hour=None, existing_text="", parent=None):
         """Initialize the dialog."""
         super().__init__(parent)
@@ -56,9 +95,6 @@ class ActivityInputDialog(QDialog):
         self.setWindowTitle("Activity Entry")
         self.setMinimumWidth(450)
 
-        # Load stylesheet
-        self.load_stylesheet()
-
         self.init_ui()
 
     def init_ui(self):
@@ -98,33 +134,22 @@ class ActivityInputDialog(QDialog):
         self.activity_input.setMinimumHeight(120)
         card_layout.addWidget(self.activity_input)
 
-        # Common activities (could be populated from frequently used activities)
+        # Common activities
         common_group = QGroupBox("Quick Select")
         common_layout = QGridLayout()
         common_layout.setSpacing(10)
 
-        common_activities = [
-            "Working",
-            "Meeting",
-            "Eating",
-            "Break",
-            "Exercise",
-            "Reading",
-            "Learning",
-            "Sleeping",
-            "Coding",
-            "Writing",
-            "Planning",
-            "Relaxing",
-        ]
+        # One group dispatches every quick select click through a single signal
+        self.quick_select_group = QButtonGroup(self)
+        self.quick_select_group.buttonClicked.connect(self._on_quick_select)
 
+        # Suspend updates so the grid lays out once after all buttons are added
+        common_group.setUpdatesEnabled(False)
         row, col = 0, 0
-        for activity in common_activities:
+        for activity in self.COMMON_ACTIVITIES:
             btn = QPushButton(activity)
             btn.setObjectName("secondaryButton")
-            btn.clicked.connect(
-                lambda checked, text=activity: self.activity_input.setText(text)
-            )
+            self.quick_select_group.addButton(btn)
             common_layout.addWidget(btn, row, col)
             col += 1
             if col > 3:
@@ -132,6 +157,7 @@ class ActivityInputDialog(QDialog):
                 row += 1
 
         common_group.setLayout(common_layout)
+        common_group.setUpdatesEnabled(True)
         card_layout.addWidget(common_group)
 
         # Buttons
@@ -154,24 +180,102 @@ class ActivityInputDialog(QDialog):
         # Add the card to the main layout
         layout.addWidget(card)
 
-    def load_stylesheet(self):
-        """Load the application stylesheet."""
-        try:
-            import os
-
-            style_path = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), "resources", "style.qss"
-            )
-            with open(style_path, "r") as f:
-                self.setStyleSheet(f.read())
-        except Exception as e:
-            print(f"Error loading stylesheet: {e}")
+    @pyqtSlot(QAbstractButton)
+    def _on_quick_select(self, button):
+        """Fill the input with the text of the clicked quick select button."""
+        self.activity_input.setText(button.text())
 
     def get_activity_text(self):
         """Get the entered activity text."""
         return self.activity_input.toPlainText().strip()
 
 
+class _FetchSignals(QObject):
+    """Signals for _FetchTask, which cannot emit them itself."""
+
+    finished = pyqtSignal(int, list)
+
+
+class _FetchTask(QRunnable):
+    """Thread pool task that loads the activities for a date range."""
+
+    def __init__(self, db_path, start_date, end_date, generation):
+        """Initialize the task."""
+        super().__init__()
+
+        self.db_path = db_path
+        self.start_date = start_date
+        self.end_date = end_date
+        self.generation = generation
+        self.signals = _FetchSignals()
+
+    def run(self):
+        """Query the activities and hand them back to the GUI thread."""
+        # sqlite3 connections are bound to the thread that opened them, so read
+        # through a connection of our own
+        db = Database(self.db_path)
+        try:
+            db.open_readonly()
+            activities = db.get_activities_for_date_range(
+                self.start_date, self.end_date
+            )
+        except Exception as e:
+            print(f"Error loading summary activities: {e}")
+            activities = []
+        finally:
+            db.close()
+
+        self.signals.finished.emit(self.generation, activities)
+
+
+class AccountabilityHourModel(QAbstractListModel):
+    """List model exposing one row per hour of the day with its activity."""
+
+    EMPTY_TEXT = "No activity recorded"
+
+    def __init__(self, parent=None):
+        """Initialize the model with 24 empty hours."""
+        super().__init__(parent)
+
+        self._activities = [None] * 24
+        self._empty_color = QColor("#9aa0a6")
+
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of hour rows."""
+        if parent.isValid():
+            return 0
+        return len(self._activities)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Format the hour row text on demand."""
+        if not index.isValid():
+            return None
+
+        hour = index.row()
+        activity_text = self._activities[hour]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if activity_text is None:
+                return f"{HOUR_RANGES[hour]}: {self.EMPTY_TEXT}"
+            # Rows share one height, so show multi-line entries on one line
+            return f"{HOUR_RANGES[hour]}: {' '.join(activity_text.split())}"
+
+        if role == Qt.ItemDataRole.ForegroundRole and activity_text is None:
+            return self._empty_color  # Gray color for empty slots
+
+        return None
+
+    def set_activities(self, activity_dict):
+        """Replace the displayed activities with those in activity_dict."""
+        self._activities = [activity_dict.get(hour) for hour in range(24)]
+        # The 24 rows never change, so refresh their data in place
+        self.dataChanged.emit(
+            self.index(0),
+            self.index(len(self._activities) - 1),
+            [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole],
+        )
+
+
 class DailySummaryWidget(QWidget):
     """Widget for displaying a summary of the day's activities."""
 
@@ -182,6 +286,12 @@ class DailySummaryWidget(QWidget):
         self.db = database
         self.date = date or datetime.now().date()
 
+        # Bumped per refresh so results from superseded fetches are dropped
+        self._fetch_generation = 0
+        self._fetch_task = None
+        # Set when an update was skipped while hidden; redone in showEvent
+        self._dirty = False
+
         self.init_ui()
 
     def init_ui(self):
@@ -229,9 +339,14 @@ class DailySummaryWidget(QWidget):
         self.activity_stats.setWordWrap(True)
         activities_layout.addWidget(self.activity_stats)
 
-        # Activity list
-        self.activity_list = QListWidget()
+        # Activity list, backed by a model that keeps the same 24 rows
+        self.activity_model = AccountabilityHourModel(self)
+        self.activity_list = QListView()
+        self.activity_list.setObjectName("hourSummaryList")
+        self.activity_list.setModel(self.activity_model)
         self.activity_list.setAlternatingRowColors(True)
+        self.activity_list.setUniformItemSizes(True)
+        self.activity_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.activity_list.setMaximumHeight(300)
         self.activity_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.activity_list.installEventFilter(self)
@@ -252,10 +367,8 @@ class DailySummaryWidget(QWidget):
         score_container = QHBoxLayout()
 
         self.score_label = QLabel()
+        self.score_label.setObjectName("consistencyScore")
         self.score_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.score_label.setStyleSheet(
-            "font-size: 42px; font-weight: bold; color: #1a73e8;"
-        )
         score_container.addWidget(self.score_label)
 
         score_layout.addLayout(score_container)
@@ -270,8 +383,8 @@ class DailySummaryWidget(QWidget):
         scroll.setWidget(content)
         layout.addWidget(scroll)
 
-        # Update the summary with current date
-        self.update_summary()
+        # No initial update: MainWindow.on_tab_changed fills the summary in
+        # when its tab is first opened
 
     def set_date(self, date):
         """Set the date to display summary for."""
@@ -285,6 +398,21 @@ class DailySummaryWidget(QWidget):
         self.update_summary()
 
     def update_summary(self):
+        """Update the summary display, or defer it until the widget is shown."""
+        if not self.isVisible():
+            self._dirty = True
+            return
+        self._dirty = False
+        self._do_update_summary()
+
+    def showEvent(self, event):
+        """Run any summary update that was deferred while hidden."""
+        super().showEvent(event)
+        if self._dirty:
+            self._dirty = False
+            self._do_update_summary()
+
+    def _do_update_summary(self):
         """Update the summary display with activities for the current date."""
         # Format and display the date
         if hasattr(self, "end_date"):
@@ -293,37 +421,54 @@ class DailySummaryWidget(QWidget):
             date_str = self.date.strftime("%A, %B %d, %Y")
         self.date_label.setText(date_str)
 
-        # Get activities for the date
+        self._fetch_generation += 1
+
+        # Get activities for the date; ranges can span months, so load them
+        # on the thread pool and apply them when they arrive
         if hasattr(self, "end_date"):
-            activities = self.db.get_activities_for_date_range(self.date, self.end_date)
+            task = _FetchTask(
+                self.db.db_path, self.date, self.end_date, self._fetch_generation
+            )
+            task.signals.finished.connect(self._on_fetch_finished)
+            self._fetch_task = task
+            QThreadPool.globalInstance().start(task)
         else:
-            activities = self.db.get_activities_for_day(self.date)
+            self._apply_summary(self.db.get_activities_for_day(self.date))
 
-        # Clear the activity list
-        self.activity_list.clear()
+    @pyqtSlot(int, list)
+    def _on_fetch_finished(self, generation, activities):
+        """Apply fetched activities unless a newer refresh has started."""
+        if generation != self._fetch_generation:
+            return
+        self._fetch_task = None
+        self._apply_summary(activities)
 
+    def _apply_summary(self, activities):
+        """Update the stats, score and hour list from the loaded activities."""
         # Create a dictionary of activities by hour for quick lookup
-        activity_dict = {}
-        for activity in activities:
-            hour = activity["hour"]
-            activity_dict[hour.hour] = activity["activity"]
+        activity_dict = {a["hour"].hour: a["activity"] for a in activities}
 
         # Count recorded hours
         recorded_hours = len(activities)
         # calculate total hours between start and end date or current date (whichever is sooner) (inclusive)
         if hasattr(self, "end_date"):
-            if self.end_date <= datetime.now().date():
-                end_date = datetime.now()
+            now = datetime.now()
+            today = now.date()
+            if self.end_date < today:
+                # Range is over: every hour of every day counts
+                total_possible_hours = ((self.end_date - self.date).days + 1) * 24
             else:
-                end_date = datetime(
-                    self.end_date.year, self.end_date.month, self.end_date.day
-                ).replace(hour=23, minute=59, second=59, microsecond=999999)
-            # start date is self.date with a time of 00:00:00
-            start_date = datetime(self.date.year, self.date.month, self.date.day)
-            total_possible_hours = (end_date - start_date).total_seconds() // 3600
+                # Range is ongoing: count full days so far plus today up to
+                # this hour; a range that hasn't started yet has none
+                total_possible_hours = max(
+                    0, (today - self.date).days * 24 + now.hour + 1
+                )
         else:
             total_possible_hours = 24
-        completion_rate = (recorded_hours / total_possible_hours) * 100
+        if total_possible_hours:
+            completion_rate = (recorded_hours / total_possible_hours) * 100
+        else:
+            completion_rate = 0.0
 
         # Display activity stats
         stats_text = f"Recorded {recorded_hours} out of {total_possible_hours} possible hours ({completion_rate:.1f}%)."
@@ -333,62 +478,44 @@ class DailySummaryWidget(QWidget):
         score = min(100, int(completion_rate * 1.2))  # Simple formula, capped at 100
         self.score_label.setText(f"{score}")
 
-        # Set score color based on value
+        # Set score level based on value; the stylesheet colors each level
         if score >= 80:
-            self.score_label.setStyleSheet(
-                "font-size: 42px; font-weight: bold; color: #34a853;"
-            )
+            level = "excellent"
             description = (
                 "Excellent productivity! You've recorded most of your day's activities."
             )
         elif score >= 60:
-            self.score_label.setStyleSheet(
-                "font-size: 42px; font-weight: bold; color: #1a73e8;"
-            )
+            level = "good"
             description = (
                 "Good productivity. You're tracking most of your important activities."
             )
         elif score >= 40:
-            self.score_label.setStyleSheet(
-                "font-size: 42px; font-weight: bold; color: #fbbc04;"
-            )
+            level = "moderate"
             description = (
                 "Moderate productivity. Try to record more of your activities."
             )
         else:
-            self.score_label.setStyleSheet(
-                "font-size: 42px; font-weight: bold; color: #ea4335;"
-            )
+            level = "low"
             description = "Low productivity tracking. Make an effort to record more of your daily activities."
 
-        self.score_description.setText(description)
+        if self.score_label.property("scoreLevel") != level:
+            self.score_label.setProperty("scoreLevel", level)
+            # Re-polish so the [scoreLevel] selectors are re-evaluated
+            self.score_label.style().unpolish(self.score_label)
+            self.score_label.style().polish(self.score_label)
 
-        # Add all hours to the list (0-23)
-        for hour in range(24):
-            # Create datetime for this hour
-            hour_dt = datetime(self.date.year, self.date.month, self.date.day, hour)
-
-            # Format the time range
-            time_range = format_hour_range(hour_dt)
-
-            # Check if there's an activity for this hour
-            activity_text = activity_dict.get(hour, "No activity recorded")
-
-            # Create list item
-            item_text = f"{time_range}: {activity_text}"
-            item = QListWidgetItem(item_text)
-
-            # Style based on whether activity exists
-            if hour not in activity_dict:
-                item.setForeground(QColor("#9aa0a6"))  # Gray color for empty slots
+        self.score_description.setText(description)
 
-            self.activity_list.addItem(item)
+        # Hand the hours to the model; the view keeps its rows and only
+        # formats the visible ones on demand
+        self.activity_model.set_activities(activity_dict)
 
     def eventFilter(self, watched, event):
         """Custom event filter to handle selection behavior in the activity list."""
         if watched is self.activity_list and event.type() == QEvent.Type.MouseButtonPress:
             modifiers = QApplication.keyboardModifiers()
             index = self.activity_list.indexAt(event.pos())
+            selection = self.activity_list.selectionModel()
             
             # If the click didn't hit an item, pass to default handler
             if not index.isValid():
@@ -396,32 +523,32 @@ class DailySummaryWidget(QWidget):
                 
             if modifiers == Qt.KeyboardModifier.NoModifier:
                 # Regular click - select only this item
-                for i in range(self.activity_list.count()):
-                    self.activity_list.item(i).setSelected(i == index.row())
+                selection.select(index, QItemSelectionModel.SelectionFlag.ClearAndSelect)
                 return True
                 
             elif modifiers & Qt.KeyboardModifier.ShiftModifier:
                 # Shift+click - select range from last selected to this one
-                selected_items = self.activity_list.selectedItems()
-                if selected_items:
+                selected_indexes = selection.selectedIndexes()
+                if selected_indexes:
                     # Find the first selected item's row
-                    first_selected_row = self.activity_list.row(selected_items[0])
+                    first_selected_row = selected_indexes[0].row()
                     # Select all items between the first selected and the clicked one
                     start_row = min(first_selected_row, index.row())
                     end_row = max(first_selected_row, index.row())
                     
-                    # Clear current selection
-                    self.activity_list.clearSelection()
-                    
-                    # Select the range
-                    for i in range(start_row, end_row + 1):
-                        self.activity_list.item(i).setSelected(True)
+                    # Replace the current selection with the range
+                    selection.select(
+                        QItemSelection(
+                            self.activity_model.index(start_row),
+                            self.activity_model.index(end_row),
+                        ),
+                        QItemSelectionModel.SelectionFlag.ClearAndSelect,
+                    )
                     return True
                     
             elif modifiers & (Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.MetaModifier):
                 # Ctrl/Cmd+click - toggle this item's selection without affecting others
-                item = self.activity_list.item(index.row())
-                item.setSelected(not item.isSelected())
+                selection.select(index, QItemSelectionModel.SelectionFlag.Toggle)
                 return True
                 
         return super().eventFilter(watched, event)
@@ -436,6 +563,14 @@ class MainWindow(QMainWindow):
 
         self.db = database
         self.scheduler = scheduler
+        # Date the daily list's hour items refer to
+        self._loaded_date = datetime.now().date()
+
+        # Coalesces rapid date navigation into a single reload
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(50)
+        self._reload_timer.timeout.connect(self.load_activities_for_selected_date)
 
         self.init_ui()
 
@@ -444,28 +579,12 @@ class MainWindow(QMainWindow):
         event.ignore()  # Prevent the window from actually closing
         self.hide()  # Hide the window
 
-    def load_stylesheet(self):
-        """Load the application stylesheet."""
-        try:
-            import os
-
-            style_path = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), "resources", "style.qss"
-            )
-            with open(style_path, "r") as f:
-                self.setStyleSheet(f.read())
-        except Exception as e:
-            print(f"Error loading stylesheet: {e}")
-
     def init_ui(self):
         """Set up the user interface."""
         # Set window properties
         self.setWindowTitle("Accountability")
         self.setMinimumSize(900, 700)
 
-        # Load stylesheet
-        self.load_stylesheet()
-
         # Create central widget and main layout
         central_widget = QWidget()
         main_layout = QVBoxLayout(central_widget)
@@ -572,7 +691,7 @@ class MainWindow(QMainWindow):
 
         edit_button = QPushButton("Edit Selected")
         edit_button.setObjectName("secondaryButton")
-        edit_button.clicked.connect(self.on_edit_activity)
+        edit_button.clicked.connect(self._edit_selected)
         activities_header.addWidget(edit_button)
 
         activities_layout.addLayout(activities_header)
@@ -580,12 +699,19 @@ class MainWindow(QMainWindow):
         # Activities list
         self.activity_list = QListWidget()
         self.activity_list.setAlternatingRowColors(True)
+        self.activity_list.setUniformItemSizes(True)
         self.activity_list.setSelectionMode(
             QAbstractItemView.SelectionMode.ExtendedSelection
         )
-        self.activity_list.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.activity_list.itemDoubleClicked.connect(self._edit_from_item)
         self.activity_list.setMinimumHeight(300)  # Set minimum height
         self.activity_list.installEventFilter(self)  # Add event filter for custom selection
+        # One persistent item per hour; date changes update them in place
+        for hour in range(24):
+            item = QListWidgetItem(HOUR_RANGES[hour])
+            item.setData(Qt.ItemDataRole.UserRole, hour)
+            item.setData(Qt.ItemDataRole.UserRole + 2, "")
+            self.activity_list.addItem(item)
         activities_layout.addWidget(self.activity_list)
 
         right_layout.addWidget(activities_frame)
@@ -669,8 +795,36 @@ class MainWindow(QMainWindow):
         self.summary_date_combo.setMinimumWidth(180)
         selector_layout.addWidget(self.summary_date_combo)
 
-        # Date range picker (initially hidden)
+        # Date range picker (initially hidden); its calendars are only
+        # built the first time "Custom Range" is selected
         self.summary_date_range_container = QWidget()
+        self.summary_start_date = None
+        self.summary_end_date = None
+        self.summary_date_range_container.setVisible(False)
+
+        # Add widgets to header layout
+        header_layout.addWidget(summary_title, 1)
+        header_layout.addWidget(selector_container)
+
+        summary_layout.addWidget(header_frame)
+        summary_layout.addWidget(self.summary_date_range_container)
+
+        # Summary content
+        content_frame = QFrame()
+        content_frame.setObjectName("card")
+        content_layout = QVBoxLayout(content_frame)
+
+        # Create summary widget
+        self.summary_widget = DailySummaryWidget(self.db)
+        content_layout.addWidget(self.summary_widget)
+
+        summary_layout.addWidget(content_frame)
+
+        # Add tab
+        self.tabs.addTab(summary_tab, "Summary")
+
+    def _build_summary_date_range(self):
+        """Create the custom range calendars inside the date range container."""
         date_range_layout = QHBoxLayout(self.summary_date_range_container)
         date_range_layout.setContentsMargins(0, 0, 0, 0)
         date_range_layout.setSpacing(8)
@@ -698,29 +852,6 @@ class MainWindow(QMainWindow):
         apply_button.clicked.connect(self.on_apply_summary_date_range)
         date_range_layout.addWidget(apply_button)
 
-        self.summary_date_range_container.setVisible(False)
-
-        # Add widgets to header layout
-        header_layout.addWidget(summary_title, 1)
-        header_layout.addWidget(selector_container)
-
-        summary_layout.addWidget(header_frame)
-        summary_layout.addWidget(self.summary_date_range_container)
-
-        # Summary content
-        content_frame = QFrame()
-        content_frame.setObjectName("card")
-        content_layout = QVBoxLayout(content_frame)
-
-        # Create summary widget
-        self.summary_widget = DailySummaryWidget(self.db)
-        content_layout.addWidget(self.summary_widget)
-
-        summary_layout.addWidget(content_frame)
-
-        # Add tab
-        self.tabs.addTab(summary_tab, "Summary")
-
     def setup_analysis_tab(self):
         """Set up the analysis tab."""
         analysis_tab = QWidget()
@@ -733,16 +864,8 @@ class MainWindow(QMainWindow):
         content_frame.setObjectName("card")
         content_layout = QVBoxLayout(content_frame)
 
-        # Create AI analyzer instance
-        from ..ai_analysis import AIAnalyzer
-
-        db_path = None
-        if hasattr(self.db, "db_path"):
-            db_path = self.db.db_path
-        analyzer = AIAnalyzer(db_path=db_path)
-
-        # Create analysis widget
-        self.analysis_widget = AnalysisWidget(self.db, analyzer, self)
+        # Create analysis widget; it builds its AI analyzer once the window is up
+        self.analysis_widget = AnalysisWidget(self.db, parent=self)
         content_layout.addWidget(self.analysis_widget)
 
         analysis_layout.addWidget(content_frame)
@@ -765,12 +888,11 @@ class MainWindow(QMainWindow):
 
     def load_activities_for_selected_date(self):
         """Load activities for the currently selected date."""
-        # Clear the activity list
-        self.activity_list.clear()
-
         # Get the selected date
-        qdate = self.calendar.selectedDate()
-        date = datetime(qdate.year(), qdate.month(), qdate.day())
+        date = self.calendar.selectedDate().toPyDate()
+
+        # Remember the date the hour items refer to
+        self._loaded_date = date
 
         # Format the date for display
         formatted_date = date.strftime("%A, %B %d, %Y")
@@ -780,38 +902,45 @@ class MainWindow(QMainWindow):
         activities = self.db.get_activities_for_day(date)
 
         # Create a dictionary of activities by hour for quick lookup
-        activity_dict = {}
-        for activity in activities:
-            hour = activity["hour"]
-            activity_dict[hour.hour] = activity["activity"]
+        activity_dict = {a["hour"].hour: a["activity"] for a in activities}
+
+        # Update the 24 persistent hour items in place with repaints and
+        # signals suspended so the list redraws once instead of per row
+        self.activity_list.setUpdatesEnabled(False)
+        self.activity_list.blockSignals(True)
+        self.activity_list.clearSelection()
+
+        # Bind the roles and colors once rather than per hour; the hour
+        # number in UserRole is set when the items are created
+        status_role = Qt.ItemDataRole.UserRole + 1
+        text_role = Qt.ItemDataRole.UserRole + 2
+        dark = QColor("#202124")
+        gray = QColor("#9aa0a6")
 
-        # Add all hours to the list (0-23)
         for hour in range(24):
-            # Create datetime for this hour
-            hour_dt = datetime(date.year, date.month, date.day, hour)
+            item = self.activity_list.item(hour)
 
-            # Format the time range
-            time_range = format_hour_range(hour_dt)
+            # Look up the precomputed time range
+            time_range = HOUR_RANGES[hour]
 
             # Check if there's an activity for this hour
             if hour in activity_dict:
                 activity_text = activity_dict[hour]
-                item_text = f"{time_range}: {activity_text}"
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.ItemDataRole.UserRole, hour_dt)
+                # Rows share one height, so show multi-line entries on one line
+                item.setText(f"{time_range}: {' '.join(activity_text.split())}")
 
                 # Style for completed hours
-                item.setForeground(QColor("#202124"))  # Dark text
-                item.setData(Qt.ItemDataRole.UserRole + 1, "completed")
+                item.setForeground(dark)  # Dark text
+                item.setData(status_role, "completed")
+                item.setData(text_role, activity_text)
             else:
                 # Hour without activity
-                item_text = f"{time_range}: No activity recorded"
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.ItemDataRole.UserRole, hour_dt)
-                item.setForeground(QColor("#9aa0a6"))  # Gray text
-                item.setData(Qt.ItemDataRole.UserRole + 1, "empty")
-
-            self.activity_list.addItem(item)
+                item.setText(f"{time_range}: No activity recorded")
+                item.setForeground(gray)  # Gray text
+                item.setData(status_role, "empty")
+                item.setData(text_role, "")
+        self.activity_list.blockSignals(False)
+        self.activity_list.setUpdatesEnabled(True)
 
         # Load notes for the selected date
         notes = self.db.get_daily_note(date)
@@ -820,7 +949,7 @@ class MainWindow(QMainWindow):
     @pyqtSlot()
     def on_date_selected(self):
         """Handle date selection in the calendar."""
-        self.load_activities_for_selected_date()
+        self._reload_timer.start()
 
     @pyqtSlot()
     def on_previous_day(self):
@@ -828,7 +957,7 @@ class MainWindow(QMainWindow):
         current_date = self.calendar.selectedDate()
         prev_date = current_date.addDays(-1)
         self.calendar.setSelectedDate(prev_date)
-        self.load_activities_for_selected_date()
+        self._reload_timer.start()
 
     @pyqtSlot()
     def on_today(self):
@@ -842,60 +971,65 @@ class MainWindow(QMainWindow):
         current_date = self.calendar.selectedDate()
         next_date = current_date.addDays(1)
         self.calendar.setSelectedDate(next_date)
-        self.load_activities_for_selected_date()
+        self._reload_timer.start()
+
+    def _hour_datetime(self, hour):
+        """Build the datetime for an hour of the loaded date."""
+        date = self._loaded_date
+        return datetime(date.year, date.month, date.day, hour)
 
     @pyqtSlot()
-    def on_edit_activity(self, item=None, hours=[], text=""):
-        """Edit the selected activities."""
-        if len(hours) == 0:
-            selected_items = [item] if item else self.activity_list.selectedItems()
-            if not selected_items:
-                QMessageBox.warning(
-                    self, "No Selection", "Please select hours to edit."
-                )
-                return
+    def _edit_selected(self):
+        """Edit the activity for the selected hours."""
+        selected_items = self.activity_list.selectedItems()
+        if not selected_items:
+            QMessageBox.warning(self, "No Selection", "Please select hours to edit.")
+            return
 
-            # Get all selected hours
-            hours = [item.data(Qt.ItemDataRole.UserRole) for item in selected_items]
-            print(f"DEBUG: Selected hours: {hours}")
+        # Get all selected hours; items only store the hour of the day
+        hours = [
+            self._hour_datetime(item.data(Qt.ItemDataRole.UserRole))
+            for item in selected_items
+        ]
+
+        # Prefill the text only when every selected hour shares it
+        texts = {item.data(Qt.ItemDataRole.UserRole + 2) for item in selected_items}
+        text = texts.pop() if len(texts) == 1 else ""
+
+        self._open_activity_dialog(hours, text)
+
+    @pyqtSlot(QListWidgetItem)
+    def _edit_from_item(self, item):
+        """Edit the activity for a double-clicked hour."""
+        hours = [self._hour_datetime(item.data(Qt.ItemDataRole.UserRole))]
+        text = item.data(Qt.ItemDataRole.UserRole + 2) or ""
+        self._open_activity_dialog(hours, text)
 
-            text = (
-                selected_items[0].text().split(":", 3)[3].strip()
-            )  # Do the third one because it has two. The format is 11:00 AM - 12:00 PM: Activity.
-            for item in selected_items[1:]:
-                if item.text().split(":", 3)[3].strip() != text:
-                    text = ""
-                    break
+    @pyqtSlot()
+    def on_edit_current_activity(self):
+        """Edit the activity for the current hour."""
+        self._open_activity_dialog([datetime.now()], "")
 
-        print(f"DEBUG: Extracted text: '{text}'")
+    def _open_activity_dialog(self, hours, text):
+        """Ask for an activity and record it for the given hours."""
+        logger.debug("Selected hours: %s", hours)
+        logger.debug("Extracted text: %r", text)
 
         # Open dialog to enter activity for all selected hours
         dialog = ActivityInputDialog(parent=self, existing_text=text)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             activity_text = dialog.get_activity_text()
-            print(f"DEBUG: New activity text: '{activity_text}'")
+            logger.debug("New activity text: %r", activity_text)
 
             if activity_text:
                 # Record the activity for all selected hours
-                print(f"DEBUG: About to record activity")
+                logger.debug("About to record activity")
                 self.scheduler.record_activity(hours, activity_text)
-                print(f"DEBUG: Activity recorded")
+                logger.debug("Activity recorded")
 
                 # Refresh the display
                 self.refresh_data()
-                print(f"DEBUG: Display refreshed")
-
-    @pyqtSlot()
-    def on_edit_current_activity(self):
-        """Edit the activity for the current hour."""
-        # get current datetime
-        now = datetime.now()
-        self.on_edit_activity(hours=[now])
-
-    @pyqtSlot(QListWidgetItem)
-    def on_item_double_clicked(self, item):
-        """Handle double-clicking an activity item."""
-        return self.on_edit_activity(item)
+                logger.debug("Display refreshed")
 
     @pyqtSlot(int)
     def on_tab_changed(self, index):
@@ -940,7 +1074,9 @@ class MainWindow(QMainWindow):
                 )
             self.summary_widget.set_date_range(start_of_month, end_of_month)
         elif index == 5:  # Custom Range
-            # Show date range picker
+            # Build the calendars on first use, then show the date range picker
+            if self.summary_start_date is None:
+                self._build_summary_date_range()
             self.summary_date_range_container.setVisible(True)
             # Set default range (last 7 days)
             self.summary_start_date.setSelectedDate(
@@ -982,8 +1118,7 @@ class MainWindow(QMainWindow):
         notes = self.notes_editor.toPlainText()
 
         # Get the selected date
-        qdate = self.calendar.selectedDate()
-        date = datetime(qdate.year(), qdate.month(), qdate.day())
+        date = self.calendar.selectedDate().toPyDate()
 
         # Save to database
         success = self.db.save_daily_note(date, notes)
@@ -4,22 +4,31 @@ Provides the popup reminder for recording hourly activities.
 """
 
 from datetime import datetime, timedelta
+from functools import partial
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QTextEdit,
+    QPlainTextEdit,
     QListWidget,
     QListWidgetItem,
+    QListView,
     QAbstractItemView,
-    QDialogButtonBox,
     QFrame,
-    QScrollArea,
 )
 from PyQt6.QtCore import Qt, pyqtSlot
-from PyQt6.QtGui import QColor, QFont, QIcon
+from PyQt6.QtGui import QColor, QIcon
+
+from accountability.utils.time_utils import format_hour_range
+
+# Hour list item prefixes
+MISSED_PREFIX = "⚠️ "
+PENDING_PREFIX = "🕒 "
+
+# Looked up from the icon theme on first use, then shared by every dialog
+_SNOOZE_ICON = None
 
 
 class ReminderDialog(QDialog):
@@ -37,38 +46,26 @@ class ReminderDialog(QDialog):
         """
         super().__init__(parent)
 
-        self.hours = hours
+        # The set gives O(1) membership; the list stays sorted for display
+        self._hours_set = set(hours)
+        self.hours = sorted(self._hours_set)
         self.db = database
         self.scheduler = scheduler
         self.selected_hours = []
+        # Hour list items by hour, reused across populate_hour_list calls
+        self._item_cache = {}
 
         # Configure dialog
         self.setWindowTitle("Record Your Activities")
         self.setWindowFlags(Qt.WindowType.WindowStaysOnTopHint)
         self.setMinimumSize(550, 450)
 
-        # Load stylesheet
-        self.load_stylesheet()
-
         # Build UI
         self.init_ui()
 
         # Don't allow closing with X button
         self.setWindowFlag(Qt.WindowType.WindowCloseButtonHint, False)
 
-    def load_stylesheet(self):
-        """Load the application stylesheet."""
-        try:
-            import os
-
-            style_path = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), "resources", "style.qss"
-            )
-            with open(style_path, "r") as f:
-                self.setStyleSheet(f.read())
-        except Exception as e:
-            print(f"Error loading stylesheet: {e}")
-
     def init_ui(self):
         """Set up the user interface."""
         layout = QVBoxLayout(self)
@@ -89,14 +86,11 @@ class ReminderDialog(QDialog):
         card_layout.addWidget(title)
 
         # Count of hours to fill in
-        hours_count = len(self.hours)
-        if hours_count == 1:
-            subtitle = QLabel(f"Please record your activity for the past hour:")
-        else:
-            subtitle = QLabel(f"Please record your activities for {hours_count} hours:")
-        subtitle.setObjectName("subtitle")
-        subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        card_layout.addWidget(subtitle)
+        self.subtitle = QLabel()
+        self.subtitle.setObjectName("subtitle")
+        self.subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.update_subtitle()
+        card_layout.addWidget(self.subtitle)
 
         # List of hours
         hours_container = QFrame()
@@ -111,6 +105,10 @@ class ReminderDialog(QDialog):
 
         self.hour_list = QListWidget()
         self.hour_list.setAlternatingRowColors(True)
+        # Rows are single-line and equal height; lay out long backlogs in batches
+        self.hour_list.setUniformItemSizes(True)
+        self.hour_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.hour_list.setBatchSize(64)
         self.hour_list.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
         self.hour_list.setMaximumHeight(180)
         self.populate_hour_list()
@@ -120,8 +118,7 @@ class ReminderDialog(QDialog):
         info_label = QLabel(
             "You can select multiple hours and enter the same activity for all of them."
         )
-        info_label.setObjectName("subtitle")
-        info_label.setStyleSheet("font-style: italic; color: #5f6368;")
+        info_label.setObjectName("infoHint")
         hours_layout.addWidget(info_label)
         
         card_layout.addWidget(hours_container)
@@ -131,7 +128,7 @@ class ReminderDialog(QDialog):
         input_label.setObjectName("sectionTitle")
         card_layout.addWidget(input_label)
 
-        self.activity_input = QTextEdit()
+        self.activity_input = QPlainTextEdit()
         self.activity_input.setPlaceholderText("What were you doing during this time?")
         self.activity_input.setMinimumHeight(120)
         card_layout.addWidget(self.activity_input)
@@ -146,7 +143,7 @@ class ReminderDialog(QDialog):
         for suggestion in suggestions:
             btn = QPushButton(suggestion)
             btn.setObjectName("secondaryButton")
-            btn.clicked.connect(lambda checked, text=suggestion: self.activity_input.setText(text))
+            btn.clicked.connect(partial(self._set_activity, suggestion))
             suggestions_layout.addWidget(btn)
             
         card_layout.addLayout(suggestions_layout)
@@ -157,7 +154,10 @@ class ReminderDialog(QDialog):
 
         self.snooze_button = QPushButton("Snooze (10 min)")
         self.snooze_button.setObjectName("secondaryButton")
-        self.snooze_button.setIcon(QIcon.fromTheme("appointment-soon"))
+        global _SNOOZE_ICON
+        if _SNOOZE_ICON is None:
+            _SNOOZE_ICON = QIcon.fromTheme("appointment-soon")
+        self.snooze_button.setIcon(_SNOOZE_ICON)
         self.snooze_button.clicked.connect(self.on_snooze)
 
         self.record_button = QPushButton("Record Activity")
@@ -173,35 +173,85 @@ class ReminderDialog(QDialog):
         # Add the card to the main layout
         layout.addWidget(card)
 
+    def update_subtitle(self):
+        """Show how many hours are waiting to be recorded."""
+        hours_count = len(self.hours)
+        if hours_count == 1:
+            self.subtitle.setText("Please record your activity for the past hour:")
+        else:
+            self.subtitle.setText(f"Please record your activities for {hours_count} hours:")
+
+    def set_hours(self, hours):
+        """
+        Reset the dialog for a new set of hours so it can be shown again.
+
+        Args:
+            hours: List of datetime objects representing hours to record
+        """
+        self._hours_set = set(hours)
+        self.hours = sorted(self._hours_set)
+        self.selected_hours = []
+        self.activity_input.clear()
+        self.update_subtitle()
+        self.populate_hour_list()
+
     def populate_hour_list(self):
-        """Populate the list with hours that need to be recorded."""
-        self.hour_list.clear()
+        """
+        Bring the list in line with the hours that need to be recorded.
 
-        for hour in sorted(self.hours):
-            # Format the hour range (e.g., "9:00 AM - 10:00 AM")
-            start_time = hour.strftime("%I:%M %p").lstrip("0")
-            end_time = (hour + timedelta(hours=1)).strftime("%I:%M %p").lstrip("0")
-            item_text = f"{start_time} - {end_time}"
+        Items are kept in _item_cache across calls, so only hours that were
+        added or removed since the last call create or destroy an item.
+        """
+        now = datetime.now()
+        one_hour = timedelta(hours=1)
+        missed_color = QColor("#ea4335")  # Red for missed hours
+
+        # Update with repaints and signals suspended
+        self.hour_list.setUpdatesEnabled(False)
+        self.hour_list.blockSignals(True)
+
+        # Drop items for hours that are no longer pending
+        for hour in [hour for hour in self._item_cache if hour not in self._hours_set]:
+            item = self._item_cache.pop(hour)
+            self.hour_list.takeItem(self.hour_list.row(item))
+
+        # The remaining items are already in order, so inserting new hours at
+        # their index in the sorted list keeps the whole list sorted
+        for row, hour in enumerate(self.hours):
+            item = self._item_cache.get(hour)
+            if item is None:
+                item = QListWidgetItem()
+                item.setData(Qt.ItemDataRole.UserRole, hour)
+                self._item_cache[hour] = item
+                self.hour_list.insertItem(row, item)
+
+            # Restyle only when the hour changes between pending and missed
+            state = "missed" if hour + one_hour < now else "pending"
+            if item.data(Qt.ItemDataRole.UserRole + 1) == state:
+                continue
+            item.setData(Qt.ItemDataRole.UserRole + 1, state)
 
-            # Create and add the item
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, hour)
+            # Format the hour range (e.g., "9:00 AM - 10:00 AM")
+            item_text = format_hour_range(hour)
 
             # Style the item
-            now = datetime.now()
-            if hour + timedelta(hours=1) < now:
+            if state == "missed":
                 # Past hours (missed)
-                item.setForeground(QColor("#ea4335"))  # Red for missed hours
-                item.setData(Qt.ItemDataRole.UserRole + 1, "missed")
-                item.setText(f"⚠️ {item_text} (missed)")
+                item.setForeground(missed_color)
+                item.setText(f"{MISSED_PREFIX}{item_text} (missed)")
             else:
-                item.setText(f"🕒 {item_text}")
-
-            self.hour_list.addItem(item)
+                item.setText(PENDING_PREFIX + item_text)
 
         # Select the first hour by default
+        self.hour_list.clearSelection()
         if self.hour_list.count() > 0:
             self.hour_list.item(0).setSelected(True)
+        self.hour_list.blockSignals(False)
+        self.hour_list.setUpdatesEnabled(True)
+
+    def _set_activity(self, text, _checked=False):
+        """Fill the activity input with a suggestion."""
+        self.activity_input.setPlainText(text)
 
     @pyqtSlot()
     def on_record(self):
@@ -222,17 +272,30 @@ class ReminderDialog(QDialog):
         # Record the activity for each selected hour
         self.scheduler.record_activity(selected_hours, activity_text)
 
-        # Remove recorded hours from the list
-        for item in selected_items:
-            hour = item.data(Qt.ItemDataRole.UserRole)
-            if hour in self.hours:
-                self.hours.remove(hour)
-
         # Clear the input field
         self.activity_input.clear()
 
-        # Repopulate the list
-        self.populate_hour_list()
+        # Take only the recorded rows out of the list, bottom-up so the
+        # remaining row numbers stay valid
+        rows = sorted((self.hour_list.row(item) for item in selected_items), reverse=True)
+        self.hour_list.setUpdatesEnabled(False)
+        self.hour_list.blockSignals(True)
+        for row in rows:
+            item = self.hour_list.takeItem(row)
+            hour = item.data(Qt.ItemDataRole.UserRole)
+            self._hours_set.discard(hour)
+            self._item_cache.pop(hour, None)
+
+        # Select the first remaining hour, as a fresh list would
+        if self.hour_list.count() > 0:
+            self.hour_list.item(0).setSelected(True)
+        self.hour_list.blockSignals(False)
+        self.hour_list.setUpdatesEnabled(True)
+
+        # Drop the recorded hours from the pending list; filtering keeps it
+        # sorted without sorting again
+        recorded = set(selected_hours)
+        self.hours = [hour for hour in self.hours if hour not in recorded]
 
         # If all hours have been recorded, close the dialog
         if not self.hours:
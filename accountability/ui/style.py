@@ -0,0 +1,47 @@
+"""
+Stylesheet Module for Accountability App.
+Loads the shared application stylesheet and logo.
+"""
+
+import functools
+import os
+
+from PyQt6.QtCore import QDir
+from PyQt6.QtGui import QPixmap
+
+RESOURCES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources")
+STYLE_PATH = os.path.join(RESOURCES_DIR, "style.qss")
+LOGO_PATH = os.path.join(RESOURCES_DIR, "logo.png")
+
+
+@functools.lru_cache(maxsize=1)
+def load_stylesheet():
+    """
+    Read the application stylesheet, caching it after the first call.
+
+    Also registers the "resources:" search prefix that the stylesheet uses
+    for its images, so they resolve regardless of the working directory.
+
+    Returns:
+        str: The stylesheet contents, or an empty string if it can't be read
+    """
+    QDir.addSearchPath("resources", RESOURCES_DIR)
+    try:
+        with open(STYLE_PATH, "r") as f:
+            return f.read()
+    except Exception as e:
+        print(f"Error loading stylesheet: {e}")
+        return ""
+
+
+@functools.lru_cache(maxsize=1)
+def load_logo():
+    """
+    Decode the application logo, caching it after the first call.
+
+    Must be called after the QApplication has been created.
+
+    Returns:
+        QPixmap: The logo, or a null pixmap if it can't be read
+    """
+    return QPixmap(LOGO_PATH)
@@ -12,8 +12,23 @@ def get_current_hour():
     Returns:
         datetime: The current hour
     """
-    now = datetime.now()
-    return datetime(now.year, now.month, now.day, now.hour, 0, 0)
+    return datetime.now().replace(minute=0, second=0, microsecond=0)
+
+
+def _format_time(dt):
+    """
+    Format a datetime's time of day as a 12-hour clock string.
+
+    Equivalent to dt.strftime("%I:%M %p").lstrip("0"), built from integers
+    to avoid going through strftime.
+
+    Args:
+        dt: A datetime object
+
+    Returns:
+        str: Formatted time (e.g. "9:00 AM")
+    """
+    return f"{dt.hour % 12 or 12}:{dt.minute:02d} {'AM' if dt.hour < 12 else 'PM'}"
 
 
 def format_hour_range(hour):
@@ -26,10 +41,17 @@ def format_hour_range(hour):
     Returns:
         str: Formatted hour range (e.g. "9:00 AM - 10:00 AM")
     """
-    start_time = hour.strftime("%I:%M %p").lstrip("0")
-    end_hour = hour + timedelta(hours=1)
-    end_time = end_hour.strftime("%I:%M %p").lstrip("0")
-    return f"{start_time} - {end_time}"
+    if hour.minute == 0:
+        return HOUR_RANGES[hour.hour]
+    return f"{_format_time(hour)} - {_format_time(hour + timedelta(hours=1))}"
+
+
+# Whole-hour ranges only depend on the hour, so build all 24 labels once
+HOUR_RANGES = tuple(
+    f"{_format_time(datetime(2000, 1, 1, hour))} - "
+    f"{_format_time(datetime(2000, 1, 1, hour) + timedelta(hours=1))}"
+    for hour in range(24)
+)
 
 
 def get_hours_between(start_time, end_time):
@@ -44,19 +66,14 @@ def get_hours_between(start_time, end_time):
         list: List of datetime objects representing each hour in the range
     """
     # Ensure we're working with hours only
-    start_hour = datetime(start_time.year, start_time.month, start_time.day, 
-                         start_time.hour, 0, 0)
-    end_hour = datetime(end_time.year, end_time.month, end_time.day, 
-                       end_time.hour, 0, 0)
-    
-    hours = []
-    current = start_hour
-    
-    while current <= end_hour:
-        hours.append(current)
-        current += timedelta(hours=1)
-    
-    return hours
+    start_hour = start_time.replace(minute=0, second=0, microsecond=0)
+    end_hour = end_time.replace(minute=0, second=0, microsecond=0)
+
+    # Count the hours up front (inclusive) instead of stepping until the end
+    hour_count = int((end_hour - start_hour).total_seconds() // 3600) + 1
+    one_hour = timedelta(hours=1)
+
+    return [start_hour + i * one_hour for i in range(hour_count)]
 
 
 def get_day_start(dt):
@@ -69,7 +86,7 @@ def get_day_start(dt):
     Returns:
         datetime: The start of the day (midnight)
     """
-    return datetime(dt.year, dt.month, dt.day, 0, 0, 0)
+    return dt.replace(hour=0, minute=0, second=0, microsecond=0)
 
 
 def get_day_end(dt):
@@ -82,4 +99,4 @@ def get_day_end(dt):
     Returns:
         datetime: The end of the day (23:59:59)
     """
-    return datetime(dt.year, dt.month, dt.day, 23, 59, 59)
+    return dt.replace(hour=23, minute=59, second=59, microsecond=0)
@@ -10,26 +10,29 @@ from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt, QCoreApplication
 from PyQt6.QtGui import QIcon
 from accountability.app import AccountabilityApp
+from accountability.ui.style import load_stylesheet, load_logo
 
 def main():
     """Initialize and run the Accountability application."""
     # Set the application to be a menu bar only app (no dock icon)
     if sys.platform == 'darwin':
-        # This must be set before creating QApplication
-        # QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_PluginApplication, True) # Might interfere with background behavior
+        # These must be set before creating QApplication
+        QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings, True)
+        QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_DontShowIconsInMenus, True)
         os.environ['LSUIElement'] = '1'  # Hide from dock on macOS
         
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)  # Keep app running when window is closed
     app.setApplicationName("Accountability")
     app.setOrganizationName("YourOrganization")
+
+    # Apply the stylesheet once for every window and dialog
+    app.setStyleSheet(load_stylesheet())
     
     # Set application icon
-    icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 
-                           "accountability", "ui", "resources", "logo.png")
-    if os.path.exists(icon_path):
-        app_icon = QIcon(icon_path)
-        app.setWindowIcon(app_icon)
+    logo = load_logo()
+    if not logo.isNull():
+        app.setWindowIcon(QIcon(logo))
     
     # Initialize the main application and pass the QApplication instance
     accountability_app = AccountabilityApp(app)
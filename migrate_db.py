@@ -22,28 +22,35 @@ def migrate_database(db_path):
     try:
         # Connect to the database
         conn = sqlite3.connect(db_path)
+        # Same journaling the app uses; must be set outside a transaction
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         cursor = conn.cursor()
         
         # Check if the columns already exist
         cursor.execute("PRAGMA table_info(analysis_results)")
         columns = [column[1] for column in cursor.fetchall()]
         
-        # Add productivity_score column if it doesn't exist
-        if "productivity_score" not in columns:
-            print("Adding productivity_score column...")
-            cursor.execute("ALTER TABLE analysis_results ADD COLUMN productivity_score REAL")
-        else:
-            print("productivity_score column already exists")
-        
-        # Add productivity_explanation column if it doesn't exist
-        if "productivity_explanation" not in columns:
-            print("Adding productivity_explanation column...")
-            cursor.execute("ALTER TABLE analysis_results ADD COLUMN productivity_explanation TEXT")
-        else:
-            print("productivity_explanation column already exists")
+        # sqlite3 doesn't open a transaction for ALTER TABLE on its own, so
+        # start one explicitly to apply both columns with a single commit
+        with conn:
+            cursor.execute("BEGIN")
+
+            # Add productivity_score column if it doesn't exist
+            if "productivity_score" not in columns:
+                print("Adding productivity_score column...")
+                cursor.execute("ALTER TABLE analysis_results ADD COLUMN productivity_score REAL")
+            else:
+                print("productivity_score column already exists")
+            
+            # Add productivity_explanation column if it doesn't exist
+            if "productivity_explanation" not in columns:
+                print("Adding productivity_explanation column...")
+                cursor.execute("ALTER TABLE analysis_results ADD COLUMN productivity_explanation TEXT")
+            else:
+                print("productivity_explanation column already exists")
         
-        # Commit changes and close connection
-        conn.commit()
+        # Close connection
         conn.close()
         
         print("Database migration completed successfully!")